@@ -96,7 +96,9 @@ class RecordMessage(Message):
         if self.version is not None:
             result["version"] = self.version
         if self.time_extracted is not None:
-            result["time_extracted"] = self.time_extracted
+            # Serialize explicitly so that plain `datetime` values are formatted
+            # as ISO 8601 rather than with `str()`.
+            result["time_extracted"] = self.time_extracted.isoformat()
         return result
 
     def __post_init__(self) -> None:
@@ -188,8 +190,14 @@ def format_message(message: Message) -> str:
 def write_message(message: Message) -> None:
     """Write a message to stdout.
 
+    RECORD messages are left in stdout's own block buffer so that a flush
+    syscall is not issued for every record. Any other message type forces a
+    flush, which also drains previously buffered records first, so message
+    ordering on the wire is unchanged.
+
     Args:
         message: The message to write.
     """
     sys.stdout.write(format_message(message) + "\n")
-    sys.stdout.flush()
+    if message.type is not SingerMessageType.RECORD:
+        sys.stdout.flush()
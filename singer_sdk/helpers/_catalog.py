@@ -92,6 +92,41 @@ def pop_deselected_record_properties(
             )
 
 
+def get_deselected_record_paths(mask: SelectionMask) -> list[tuple[str, ...]]:
+    """Return the record property paths which are deselected in the given mask.
+
+    The mask holds fully resolved selection values, so the deselected paths are
+    simply the breadcrumbs mapped to False, converted from breadcrumb form
+    (`('properties', 'a', 'properties', 'b')`) to record-key form (`('a', 'b')`).
+    """
+    return [
+        breadcrumb[1::2]
+        for breadcrumb, selected in mask.items()
+        if breadcrumb and not selected
+    ]
+
+
+def pop_deselected_paths_from_record(
+    record: dict[str, Any],
+    deselected_paths: list[tuple[str, ...]],
+) -> None:
+    """Remove the given deselected property paths from a record, in place.
+
+    Unlike `pop_deselected_record_properties`, this does not walk the full
+    record; it only visits the (precomputed) deselected paths, so the
+    per-record cost is proportional to the number of deselections rather
+    than the record size.
+    """
+    for path in deselected_paths:
+        parent: Any = record
+        for key in path[:-1]:
+            parent = parent.get(key)
+            if not isinstance(parent, dict):
+                break
+        else:
+            parent.pop(path[-1], None)
+
+
 def deselect_all_streams(catalog: Catalog) -> None:
     """Deselect all streams in catalog dictionary."""
     for entry in catalog.streams:
@@ -7,7 +7,7 @@ import datetime
 import logging
 from enum import Enum
 from functools import lru_cache
-from typing import Any, cast
+from typing import Any, Callable, cast
 
 import pendulum
 
@@ -202,11 +202,11 @@ def handle_invalid_timestamp_in_record(
         f"field '{':'.join(key_breadcrumb)}'."
     )
     if treatment == DatetimeErrorTreatmentEnum.MAX:
-        logger.warning(f"{msg}. Replacing with MAX value.\n{ex}\n")
+        logger.warning("%s. Replacing with MAX value.\n%s\n", msg, ex)
         return _MAX_TIMESTAMP if datelike_typename != "time" else _MAX_TIME
 
     if treatment == DatetimeErrorTreatmentEnum.NULL:
-        logger.warning(f"{msg}. Replacing with NULL.\n{ex}\n")
+        logger.warning("%s. Replacing with NULL.\n%s\n", msg, ex)
         return None
 
     raise ValueError(msg)
@@ -311,8 +311,10 @@ def _warn_unmapped_properties(
     stream_name: str, property_names: tuple[str], logger: logging.Logger
 ):
     logger.warning(
-        f"Properties {property_names} were present in the '{stream_name}' stream but "
-        "not found in catalog schema. Ignoring."
+        "Properties %s were present in the '%s' stream but "
+        "not found in catalog schema. Ignoring.",
+        property_names,
+        stream_name,
     )
 
 
@@ -364,6 +366,138 @@ def conform_record_data_types(  # noqa: C901
     return rec
 
 
+def build_conformer(
+    stream_name: str,
+    schema: dict,
+    level: TypeConformanceLevel,
+    logger: logging.Logger,
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Compile a record conformer specialized for the given schema.
+
+    The returned callable behaves like :func:`conform_record_data_types` with
+    the given arguments bound, but the per-property schema introspection
+    (uniform-list, object and boolean type detection) is performed once here
+    rather than for every record.
+    """
+    if level == TypeConformanceLevel.NONE:
+        return lambda record: record
+
+    conform_object = _compile_object_conformer(schema, level, None)
+
+    def conformer(record: dict[str, Any]) -> dict[str, Any]:
+        unmapped_properties: list[str] = []
+        output = conform_object(record, unmapped_properties)
+        if unmapped_properties:
+            _warn_unmapped_properties(stream_name, tuple(unmapped_properties), logger)
+        return output
+
+    return conformer
+
+
+def _compile_object_conformer(
+    schema: dict,
+    level: TypeConformanceLevel,
+    parent: str | None,
+) -> Callable[[dict[str, Any], list[str]], dict[str, Any]]:
+    """Compile a conformer for an object schema's properties.
+
+    Mirrors the dispatch logic of `_conform_record_data_types`, with the
+    schema-dependent branch conditions evaluated at compile time. The returned
+    callable takes a record dict and a shared list collecting unmapped
+    property paths.
+    """
+    recursive = level == TypeConformanceLevel.RECURSIVE
+
+    def _make_handler(
+        property_schema: dict,
+        property_path: str,
+    ) -> Callable[[Any, list[str]], Any]:
+        if not isinstance(property_schema, dict):
+            # Boolean property schemas carry no type info; defer to the
+            # generic primitive conformance for each value.
+            return lambda elem, unmapped_properties: _conform_primitive_property(
+                elem, property_schema
+            )
+
+        uniform_list = is_uniform_list(property_schema)
+        is_boolean = bool(is_boolean_type(property_schema))
+        object_properties = (
+            is_object_type(property_schema) and "properties" in property_schema
+        )
+        nested = (
+            _compile_object_conformer(property_schema, level, property_path)
+            if recursive and object_properties
+            else None
+        )
+        item_schema: dict = {}
+        item_is_object = False
+        item_nested = None
+        item_is_boolean = False
+        if uniform_list and recursive:
+            item_schema = property_schema["items"]
+            item_is_object = bool(is_object_type(item_schema))
+            item_is_boolean = bool(is_boolean_type(item_schema))
+            if item_is_object and "properties" in item_schema:
+                item_nested = _compile_object_conformer(
+                    item_schema, level, property_path
+                )
+
+        def handle(elem: Any, unmapped_properties: list[str]) -> Any:
+            if uniform_list and isinstance(elem, list):
+                if not recursive:
+                    return elem
+                output = []
+                for item in elem:
+                    if item_is_object and isinstance(item, dict):
+                        if item_nested is not None:
+                            output.append(item_nested(item, unmapped_properties))
+                        else:
+                            # Fall back to the generic walker for object item
+                            # schemas without declared properties.
+                            out, sub_unmapped = _conform_record_data_types(
+                                item, item_schema, level, property_path
+                            )
+                            unmapped_properties.extend(sub_unmapped)
+                            output.append(out)
+                    else:
+                        output.append(
+                            _conform_primitive_property(
+                                item, item_schema, item_is_boolean
+                            )
+                        )
+                return output
+            if object_properties and isinstance(elem, dict):
+                return nested(elem, unmapped_properties) if nested is not None else elem
+            return _conform_primitive_property(elem, property_schema, is_boolean)
+
+        return handle
+
+    handlers = {
+        property_name: _make_handler(
+            property_schema,
+            property_name if parent is None else parent + "." + property_name,
+        )
+        for property_name, property_schema in schema["properties"].items()
+    }
+
+    def conform(
+        input_object: dict[str, Any],
+        unmapped_properties: list[str],
+    ) -> dict[str, Any]:
+        output_object: dict[str, Any] = {}
+        for property_name, elem in input_object.items():
+            handler = handlers.get(property_name)
+            if handler is None:
+                unmapped_properties.append(
+                    property_name if parent is None else parent + "." + property_name
+                )
+                continue
+            output_object[property_name] = handler(elem, unmapped_properties)
+        return output_object
+
+    return conform
+
+
 def _conform_record_data_types(
     input_object: dict[str, Any],
     schema: dict,
@@ -439,8 +573,15 @@ def _conform_record_data_types(
     return output_object, unmapped_properties
 
 
-def _conform_primitive_property(elem: Any, property_schema: dict) -> Any:
-    """Converts a primitive (i.e. not object or array) to a json compatible type."""
+def _conform_primitive_property(
+    elem: Any,
+    property_schema: dict,
+    is_boolean: bool | None = None,
+) -> Any:
+    """Converts a primitive (i.e. not object or array) to a json compatible type.
+
+    `is_boolean` may be passed precomputed to skip re-inspecting the schema.
+    """
     if isinstance(elem, (datetime.datetime, pendulum.DateTime)):
         return to_json_compatible(elem)
     elif isinstance(elem, datetime.date):
@@ -454,12 +595,12 @@ def _conform_primitive_property(elem: Any, property_schema: dict) -> Any:
     elif isinstance(elem, bytes):
         # for BIT value, treat 0 as False and anything else as True
         bit_representation: bool
-        if is_boolean_type(property_schema):
+        if is_boolean_type(property_schema) if is_boolean is None else is_boolean:
             bit_representation = elem != b"\x00"
             return bit_representation
         else:
             return elem.hex()
-    elif is_boolean_type(property_schema):
+    elif is_boolean_type(property_schema) if is_boolean is None else is_boolean:
         boolean_representation: bool | None
         if elem is None:
             boolean_representation = None
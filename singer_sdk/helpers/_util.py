@@ -8,6 +8,25 @@ from typing import Any, cast
 
 import pendulum
 
+try:
+    import orjson  # Optional dependency with a much faster JSON parser.
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def load_json(data: str | bytes) -> dict[str, Any]:
+    """Parse a JSON document, using orjson if it is installed.
+
+    Args:
+        data: The raw JSON document.
+
+    Returns:
+        The parsed JSON dictionary.
+    """
+    if orjson is not None:
+        return cast(dict, orjson.loads(data))
+    return cast(dict, json.loads(data))
+
 
 def read_json_file(path: PurePath | str) -> dict[str, Any]:
     """Read json file, thowing an error if missing."""
@@ -21,7 +40,7 @@ def read_json_file(path: PurePath | str) -> dict[str, Any]:
                 msg += f"\nFor more info, please see the sample template at: {template}"
         raise FileExistsError(msg)
 
-    return cast(dict, json.loads(Path(path).read_text()))
+    return load_json(Path(path).read_bytes())
 
 
 def utc_now() -> pendulum.DateTime:
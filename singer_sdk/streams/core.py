@@ -12,7 +12,7 @@ import logging
 from os import PathLike
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any, Generator, Iterable, Iterator, Mapping, TypeVar, cast
+from typing import Any, Callable, Generator, Iterable, Iterator, Mapping, TypeVar, cast
 from uuid import uuid4
 
 import pendulum
@@ -25,7 +25,10 @@ from singer_sdk.helpers._batch import (
     BatchConfig,
     SDKBatchMessage,
 )
-from singer_sdk.helpers._catalog import pop_deselected_record_properties
+from singer_sdk.helpers._catalog import (
+    get_deselected_record_paths,
+    pop_deselected_paths_from_record,
+)
 from singer_sdk.helpers._compat import final
 from singer_sdk.helpers._flattening import get_flattening_options
 from singer_sdk.helpers._state import (
@@ -41,10 +44,10 @@ from singer_sdk.helpers._state import (
 )
 from singer_sdk.helpers._typing import (
     TypeConformanceLevel,
-    conform_record_data_types,
+    build_conformer,
     is_datetime_type,
 )
-from singer_sdk.helpers._util import utc_now
+from singer_sdk.helpers._util import load_json, utc_now
 from singer_sdk.mapper import RemoveRecordTransform, SameRecordTransform, StreamMap
 from singer_sdk.plugin_base import PluginBase as TapBaseClass
 
@@ -56,6 +59,30 @@ REPLICATION_LOG_BASED = "LOG_BASED"
 FactoryType = TypeVar("FactoryType", bound="Stream")
 _T = TypeVar("_T")
 
+# Parsed schema files, keyed by path and stamped with the file's mtime so that
+# many stream instances sharing one schema file parse it only once.
+_SCHEMA_FILE_CACHE: dict[str, tuple[float, dict]] = {}
+
+
+def _load_schema_file(schema_filepath: Path) -> dict:
+    """Read and parse a JSON schema file, caching the parsed result.
+
+    Args:
+        schema_filepath: Path to the schema file.
+
+    Returns:
+        The parsed JSON schema dictionary.
+    """
+    key = str(schema_filepath)
+    mtime = schema_filepath.stat().st_mtime
+    cached = _SCHEMA_FILE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    schema = load_json(schema_filepath.read_bytes())
+    _SCHEMA_FILE_CACHE[key] = (mtime, schema)
+    return schema
+
 
 def lazy_chunked_generator(
     iterable: Iterable[_T],
@@ -81,6 +108,38 @@ def lazy_chunked_generator(
 class Stream(metaclass=abc.ABCMeta):
     """Abstract base class for tap streams."""
 
+    __slots__ = (
+        "name",
+        "logger",
+        "metrics_logger",
+        "tap_name",
+        "_config",
+        "_config_view",
+        "_tap",
+        "_tap_state",
+        "_tap_input_catalog",
+        "_stream_maps",
+        "forced_replication_method",
+        "_replication_key",
+        "_primary_keys",
+        "_state_partitioning_keys",
+        "_schema_filepath",
+        "_metadata",
+        "_mask",
+        "_cached_catalog_entry",
+        "_deselected_paths",
+        "_signpost_cache",
+        "_conformer",
+        "_record_message",
+        "_is_timestamp_replication_key",
+        "_schema",
+        "child_streams",
+    )
+    """Slots for instance attributes, to avoid per-instance dict storage and
+    speed up attribute access. Subclasses without ``__slots__`` still get a
+    ``__dict__`` for any additional attributes they define.
+    """
+
     STATE_MSG_FREQUENCY = 10000
     """Number of records between state messages."""
 
@@ -142,6 +201,7 @@ class Stream(metaclass=abc.ABCMeta):
         self.metrics_logger = tap.metrics_logger
         self.tap_name: str = tap.name
         self._config: dict = dict(tap.config)
+        self._config_view: Mapping[str, Any] = MappingProxyType(self._config)
         self._tap = tap
         self._tap_state = tap.state
         self._tap_input_catalog: singer.Catalog | None = None
@@ -153,16 +213,23 @@ class Stream(metaclass=abc.ABCMeta):
         self._schema_filepath: Path | None = None
         self._metadata: singer.MetadataMapping | None = None
         self._mask: singer.SelectionMask | None = None
-        self._schema: dict
+        self._schema: dict | None = None
+        self._cached_catalog_entry: singer.CatalogEntry | None = None
+        self._deselected_paths: list[tuple[str, ...]] | None = None
+        self._signpost_cache: dict[frozenset | None, Any] = {}
+        self._conformer: Callable[[dict], dict] | None = None
+        self._record_message: singer.RecordMessage | None = None
+        self._is_timestamp_replication_key: bool | None = None
         self.child_streams: list[Stream] = []
         if schema:
             if isinstance(schema, (PathLike, str)):
-                if not Path(schema).is_file():
+                schema_path = Path(schema)
+                if not schema_path.is_file():
                     raise FileNotFoundError(
-                        f"Could not find schema file '{self.schema_filepath}'."
+                        f"Could not find schema file '{schema_path}'."
                     )
 
-                self._schema_filepath = Path(schema)
+                self._schema_filepath = schema_path
             elif isinstance(schema, dict):
                 self._schema = schema
             elif isinstance(schema, singer.Schema):
@@ -172,10 +239,9 @@ class Stream(metaclass=abc.ABCMeta):
                     f"Unexpected type {type(schema).__name__} for arg 'schema'."
                 )
 
-        if self.schema_filepath:
-            self._schema = json.loads(Path(self.schema_filepath).read_text())
-
-        if not self.schema:
+        # Schema files are parsed lazily on first `schema` access, so that
+        # streams which are never selected don't pay the parse cost.
+        if not self.schema_filepath and not self.schema:
             raise ValueError(
                 f"Could not initialize schema for stream '{self.name}'. "
                 "A valid schema object or filepath was not provided."
@@ -196,12 +262,13 @@ class Stream(metaclass=abc.ABCMeta):
         if self._tap.mapper:
             self._stream_maps = self._tap.mapper.stream_maps[self.name]
             self.logger.info(
-                f"Tap has custom mapper. Using {len(self.stream_maps)} provided map(s)."
+                "Tap has custom mapper. Using %d provided map(s).",
+                len(self._stream_maps),
             )
         else:
             self.logger.info(
-                f"No custom mapper provided for '{self.name}'. "
-                "Using SameRecordTransform."
+                "No custom mapper provided for '%s'. Using SameRecordTransform.",
+                self.name,
             )
             self._stream_maps = [
                 SameRecordTransform(
@@ -224,10 +291,13 @@ class Stream(metaclass=abc.ABCMeta):
         Returns:
             True if the stream uses a timestamp-based replication key.
         """
-        if not self.replication_key:
-            return False
-        type_dict = self.schema.get("properties", {}).get(self.replication_key)
-        return is_datetime_type(type_dict)
+        if self._is_timestamp_replication_key is None:
+            if not self.replication_key:
+                self._is_timestamp_replication_key = False
+            else:
+                type_dict = self.schema.get("properties", {}).get(self.replication_key)
+                self._is_timestamp_replication_key = is_datetime_type(type_dict)
+        return self._is_timestamp_replication_key
 
     def get_starting_replication_key_value(self, context: dict | None) -> Any | None:
         """Get starting replication key.
@@ -279,7 +349,17 @@ class Stream(metaclass=abc.ABCMeta):
                 f"The replication key {self.replication_key} is not of timestamp type"
             )
 
-        return cast(datetime.datetime, pendulum.parse(value))
+        try:
+            # Fast path for ISO 8601 timestamps, which are the common case for
+            # bookmark values. Parsing with pendulum is measurably slower.
+            parsed = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            return cast(datetime.datetime, pendulum.parse(value))
+
+        if parsed.tzinfo is None:
+            # pendulum assumes UTC for naive timestamps; preserve that behavior.
+            parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+        return parsed
 
     @final
     @property
@@ -407,10 +487,19 @@ class Stream(metaclass=abc.ABCMeta):
         Returns:
             Max allowable bookmark value for this stream's replication key.
         """
-        if self.is_timestamp_replication_key:
-            return utc_now()
+        try:
+            cache_key = frozenset(context.items()) if context else None
+        except TypeError:
+            # Contexts may contain unhashable (e.g. list or dict) values, in
+            # which case the signpost is computed uncached.
+            return utc_now() if self.is_timestamp_replication_key else None
+
+        if cache_key not in self._signpost_cache:
+            self._signpost_cache[cache_key] = (
+                utc_now() if self.is_timestamp_replication_key else None
+            )
 
-        return None
+        return self._signpost_cache[cache_key]
 
     @property
     def schema_filepath(self) -> Path | None:
@@ -425,10 +514,17 @@ class Stream(metaclass=abc.ABCMeta):
     def schema(self) -> dict:
         """Get schema.
 
+        If the stream declares a schema file path, the file is parsed (and
+        cached) on first access. The public `schema_filepath` property is
+        used here so that subclasses which override it (rather than passing
+        a path to `__init__`) are honored.
+
         Returns:
             JSON Schema dictionary for this stream.
         """
-        return self._schema
+        if self._schema is None and self.schema_filepath:
+            self._schema = _load_schema_file(Path(self.schema_filepath))
+        return cast(dict, self._schema)
 
     @property
     def primary_keys(self) -> list[str] | None:
@@ -449,6 +545,7 @@ class Stream(metaclass=abc.ABCMeta):
             new_value: TODO
         """
         self._primary_keys = new_value
+        self._invalidate_singer_catalog_cache()
 
     @property
     def state_partitioning_keys(self) -> list[str] | None:
@@ -493,6 +590,7 @@ class Stream(metaclass=abc.ABCMeta):
             new_value: TODO
         """
         self._replication_key = new_value
+        self._invalidate_singer_catalog_cache()
 
     @property
     def is_sorted(self) -> bool:
@@ -554,27 +652,42 @@ class Stream(metaclass=abc.ABCMeta):
 
         return self._metadata
 
+    def _invalidate_singer_catalog_cache(self) -> None:
+        """Reset cached catalog artifacts after a stream setting has changed."""
+        self._cached_catalog_entry = None
+        self._metadata = None
+        self._mask = None
+        self._deselected_paths = None
+        self._conformer = None
+        self._is_timestamp_replication_key = None
+
     @property
     def _singer_catalog_entry(self) -> singer.CatalogEntry:
         """Return catalog entry as specified by the Singer catalog spec.
 
+        The entry is built once and memoized, since constructing it re-parses the
+        stream schema. The cache is invalidated whenever the primary keys,
+        replication key or input catalog change.
+
         Returns:
             TODO
         """
-        return singer.CatalogEntry(
-            tap_stream_id=self.tap_stream_id,
-            stream=self.name,
-            schema=singer.Schema.from_dict(self.schema),
-            metadata=self.metadata,
-            key_properties=self.primary_keys or [],
-            replication_key=self.replication_key,
-            replication_method=self.replication_method,
-            is_view=None,
-            database=None,
-            table=None,
-            row_count=None,
-            stream_alias=None,
-        )
+        if self._cached_catalog_entry is None:
+            self._cached_catalog_entry = singer.CatalogEntry(
+                tap_stream_id=self.tap_stream_id,
+                stream=self.name,
+                schema=singer.Schema.from_dict(self.schema),
+                metadata=self.metadata,
+                key_properties=self.primary_keys or [],
+                replication_key=self.replication_key,
+                replication_method=self.replication_method,
+                is_view=None,
+                database=None,
+                table=None,
+                row_count=None,
+                stream_alias=None,
+            )
+        return self._cached_catalog_entry
 
     @property
     def _singer_catalog(self) -> singer.Catalog:
@@ -592,7 +705,9 @@ class Stream(metaclass=abc.ABCMeta):
         Returns:
             A frozen (read-only) config dictionary map.
         """
-        return MappingProxyType(self._config)
+        # The proxy is a live read-only view of ``self._config``, so a single
+        # instance can be shared across all accesses.
+        return self._config_view
 
     @property
     def tap_stream_id(self) -> str:
@@ -706,17 +821,22 @@ class Stream(metaclass=abc.ABCMeta):
         Returns:
             A list of partition key dicts (if applicable), otherwise `None`.
         """
-        result: list[dict] = []
-        for partition_state in (
-            get_state_partitions_list(self.tap_state, self.name) or []
-        ):
-            result.append(partition_state["context"])
+        result: list[dict] = [
+            partition_state["context"]
+            for partition_state in (
+                get_state_partitions_list(self.tap_state, self.name) or []
+            )
+        ]
         return result or None
 
     # Private bookmarking methods
 
     def _increment_stream_state(
-        self, latest_record: dict[str, Any], *, context: dict | None = None
+        self,
+        latest_record: dict[str, Any],
+        *,
+        context: dict | None = None,
+        state_dict: dict | None = None,
     ) -> None:
         """Update state of stream or partition with data from the provided record.
 
@@ -729,12 +849,15 @@ class Stream(metaclass=abc.ABCMeta):
         Args:
             latest_record: TODO
             context: Stream partition or context dictionary.
+            state_dict: The writeable state dict for the context, if already
+                resolved by the caller. Skips the per-record state lookup.
 
         Raises:
             ValueError: TODO
         """
-        # This also creates a state entry if one does not yet exist:
-        state_dict = self.get_context_state(context)
+        if state_dict is None:
+            # This also creates a state entry if one does not yet exist:
+            state_dict = self.get_context_state(context)
 
         # Advance state bookmark values if applicable
         if latest_record and self.replication_method == REPLICATION_INCREMENTAL:
@@ -804,29 +927,51 @@ class Stream(metaclass=abc.ABCMeta):
     ) -> Generator[singer.RecordMessage, None, None]:
         """Write out a RECORD message.
 
+        A single message instance is reused for all records, with its fields
+        updated before each yield. This is safe because messages are
+        serialized synchronously by the caller; consumers must not retain a
+        yielded message beyond the next iteration.
+
         Args:
             record: A single stream record.
 
         Yields:
             Record message objects.
         """
-        pop_deselected_record_properties(record, self.schema, self.mask, self.logger)
-        record = conform_record_data_types(
-            stream_name=self.name,
-            record=record,
-            schema=self.schema,
-            level=self.TYPE_CONFORMANCE_LEVEL,
-            logger=self.logger,
-        )
+        # The deselected paths are a pure function of the selection mask, so they
+        # are computed once per sync rather than re-derived for every record.
+        # When everything is selected (e.g. no input catalog), the walk is
+        # skipped entirely.
+        if self._deselected_paths is None:
+            self._deselected_paths = get_deselected_record_paths(self.mask)
+        if self._deselected_paths:
+            pop_deselected_paths_from_record(record, self._deselected_paths)
+        # The conformer is compiled once per schema, so per-record conformance
+        # skips re-inspecting the schema's property types.
+        if self._conformer is None:
+            self._conformer = build_conformer(
+                stream_name=self.name,
+                schema=self.schema,
+                level=self.TYPE_CONFORMANCE_LEVEL,
+                logger=self.logger,
+            )
+        record = self._conformer(record)
+        record_message = self._record_message
+        if record_message is None:
+            record_message = self._record_message = singer.RecordMessage(
+                stream=self.name,
+                record={},
+                version=None,
+                time_extracted=None,
+            )
         for stream_map in self.stream_maps:
             mapped_record = stream_map.transform(record)
             # Emit record if not filtered
             if mapped_record is not None:
-                record_message = singer.RecordMessage(
-                    stream=stream_map.stream_alias,
-                    record=mapped_record,
-                    version=None,
-                    time_extracted=utc_now(),
+                record_message.stream = stream_map.stream_alias
+                record_message.record = mapped_record
+                record_message.time_extracted = datetime.datetime.now(
+                    datetime.timezone.utc
                 )
 
                 yield record_message
@@ -876,8 +1021,9 @@ class Stream(metaclass=abc.ABCMeta):
         the stream.
         """
         if len(self._sync_costs) > 0:
-            msg = f"Total Sync costs for stream {self.name}: {self._sync_costs}"
-            self.logger.info(msg)
+            self.logger.info(
+                "Total Sync costs for stream %s: %s", self.name, self._sync_costs
+            )
 
     def _check_max_record_limit(self, record_count: int) -> None:
         """TODO.
@@ -995,6 +1141,20 @@ class Stream(metaclass=abc.ABCMeta):
         context_list = [context] if context is not None else self.partitions
         selected = self.selected
 
+        # Bind loop-invariant attributes and bound methods to locals, since
+        # per-record attribute lookups add measurable overhead on large syncs.
+        stream_name = self.name
+        state_msg_frequency = self.STATE_MSG_FREQUENCY
+        max_records_limit = self._MAX_RECORDS_LIMIT
+        # Next record count at which to emit a STATE message. Tracking the
+        # threshold directly avoids a modulo on every record.
+        next_state_msg_at = 1
+        process_record = self._process_record
+        check_max_record_limit = self._check_max_record_limit
+        write_record_message = self._write_record_message
+        write_state_message = self._write_state_message
+        increment_stream_state = self._increment_stream_state
+
         with record_counter, timer:
             for current_context in context_list or [{}]:
                 record_counter.context = current_context
@@ -1018,7 +1178,7 @@ class Stream(metaclass=abc.ABCMeta):
                     else:
                         record = record_result
                     try:
-                        self._process_record(
+                        process_record(
                             record,
                             child_context=child_context,
                             partition_context=state_partition_context,
@@ -1031,20 +1191,22 @@ class Stream(metaclass=abc.ABCMeta):
                             partition_record_count=partition_record_count + 1,
                             current_context=current_context,
                             state_partition_context=state_partition_context,
-                            stream_name=self.name,
+                            stream_name=stream_name,
                         )
                         raise ex
 
-                    self._check_max_record_limit(record_count)
+                    if max_records_limit is not None:
+                        check_max_record_limit(record_count)
 
                     if selected:
-                        if (
-                            record_count - 1
-                        ) % self.STATE_MSG_FREQUENCY == 0 and write_messages:
-                            self._write_state_message()
+                        if record_count == next_state_msg_at and write_messages:
+                            write_state_message()
+                            next_state_msg_at += state_msg_frequency
                         if write_messages:
-                            self._write_record_message(record)
-                        self._increment_stream_state(record, context=current_context)
+                            write_record_message(record)
+                        increment_stream_state(
+                            record, context=current_context, state_dict=state
+                        )
 
                         yield record
 
@@ -1092,12 +1254,23 @@ class Stream(metaclass=abc.ABCMeta):
         Args:
             context: Stream partition or context dictionary.
         """
-        msg = f"Beginning {self.replication_method.lower()} sync of '{self.name}'"
         if context:
-            msg += f" with context: {context}"
-        self.logger.info(f"{msg}...")
+            self.logger.info(
+                "Beginning %s sync of '%s' with context: %s...",
+                self.replication_method.lower(),
+                self.name,
+                context,
+            )
+        else:
+            self.logger.info(
+                "Beginning %s sync of '%s'...",
+                self.replication_method.lower(),
+                self.name,
+            )
 
-        # Use a replication signpost, if available
+        # Use a replication signpost, if available. The signpost value is frozen
+        # for the duration of the sync, so reset any value from a previous run.
+        self._signpost_cache.clear()
         signpost = self.get_replication_key_signpost(context)
         if signpost:
             self._write_replication_key_signpost(context, signpost)
@@ -1133,6 +1306,7 @@ class Stream(metaclass=abc.ABCMeta):
                 replication keys, as well as selection metadata.
         """
         self._tap_input_catalog = catalog
+        self._invalidate_singer_catalog_cache()
 
         catalog_entry = catalog.get_stream(self.name)
         if catalog_entry:
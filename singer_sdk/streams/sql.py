@@ -37,6 +37,7 @@ class SQLStream(Stream, metaclass=abc.ABCMeta):
         self._connector: SQLConnector
         self._connector = connector or self.connector_class(dict(tap.config))
         self.catalog_entry = catalog_entry
+        self._parsed_catalog_entry: CatalogEntry | None = None
         super().__init__(
             tap=tap,
             schema=self.schema,
@@ -47,10 +48,18 @@ class SQLStream(Stream, metaclass=abc.ABCMeta):
     def _singer_catalog_entry(self) -> CatalogEntry:
         """Return catalog entry as specified by the Singer catalog spec.
 
+        The catalog entry dict is parsed once and memoized, since several
+        stream properties (schema, metadata, primary keys) resolve through it
+        on every access.
+
         Returns:
             A CatalogEntry object.
         """
-        return cast(CatalogEntry, CatalogEntry.from_dict(self.catalog_entry))
+        if self._parsed_catalog_entry is None:
+            self._parsed_catalog_entry = cast(
+                CatalogEntry, CatalogEntry.from_dict(self.catalog_entry)
+            )
+        return self._parsed_catalog_entry
 
     @property
     def connector(self) -> SQLConnector:
@@ -559,7 +559,8 @@ class SQLTap(Tap):
             return self._catalog_dict
 
         if self.input_catalog:
-            return self.input_catalog.to_dict()
+            self._catalog_dict = self.input_catalog.to_dict()
+            return self._catalog_dict
 
         connector = self.default_stream_class.connector_class(dict(self.config))
 
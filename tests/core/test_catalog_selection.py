@@ -9,7 +9,9 @@ import pytest
 
 import singer_sdk._singerlib as singer
 from singer_sdk.helpers._catalog import (
+    get_deselected_record_paths,
     get_selected_schema,
+    pop_deselected_paths_from_record,
     pop_deselected_record_properties,
 )
 from singer_sdk.typing import ObjectType, PropertiesList, Property, StringType
@@ -253,3 +255,18 @@ def test_record_property_pop(
     assert (
         record_pop == record_selected
     ), f"Expected record={record_selected}, got {record_pop}"
+
+
+def test_record_property_pop_precomputed_paths(
+    record: dict,
+    record_selected: dict,
+    mask: singer.SelectionMask,
+):
+    """Test that precomputed deselected paths pop the same properties."""
+    deselected_paths = get_deselected_record_paths(mask)
+    record_pop = deepcopy(record)
+    pop_deselected_paths_from_record(record_pop, deselected_paths)
+
+    assert (
+        record_pop == record_selected
+    ), f"Expected record={record_selected}, got {record_pop}"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import Any, Iterable, cast
 
 import pendulum
@@ -17,6 +18,7 @@ from singer_sdk.streams.core import (
     REPLICATION_FULL_TABLE,
     REPLICATION_INCREMENTAL,
     Stream,
+    _load_schema_file,
 )
 from singer_sdk.streams.graphql import GraphQLStream
 from singer_sdk.streams.rest import RESTStream
@@ -479,6 +481,23 @@ def test_cached_jsonpath():
     assert recompiled is compiled
 
 
+def test_cached_schema_file(tmp_path):
+    """Test parsed schema files are cached across stream instances."""
+    schema_file = tmp_path / "test.json"
+    schema_file.write_text('{"properties": {"id": {"type": "integer"}}}')
+
+    parsed = _load_schema_file(schema_file)
+    reparsed = _load_schema_file(schema_file)
+
+    # cached objects should point to the same memory location
+    assert reparsed is parsed
+
+    # a modified file should be re-parsed
+    schema_file.write_text('{"properties": {"id": {"type": "string"}}}')
+    os.utime(schema_file, (0, 0))
+    assert _load_schema_file(schema_file) is not parsed
+
+
 def test_sync_costs_calculation(tap: SimpleTestTap, caplog):
     """Test sync costs are added up correctly."""
     fake_request = requests.PreparedRequest()
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import datetime
 import logging
+from copy import deepcopy
 
 import pytest
 
 from singer_sdk.helpers._typing import (
     TypeConformanceLevel,
     _conform_primitive_property,
+    build_conformer,
     conform_record_data_types,
 )
 from singer_sdk.typing import (
@@ -247,3 +249,45 @@ def test_conform_primitives():
     assert _conform_primitive_property(None, {"type": "boolean"}) is None
     assert _conform_primitive_property(0, {"type": "boolean"}) == False
     assert _conform_primitive_property(1, {"type": "boolean"}) == True
+
+
+@pytest.mark.parametrize(
+    "level",
+    [
+        TypeConformanceLevel.RECURSIVE,
+        TypeConformanceLevel.ROOT_ONLY,
+        TypeConformanceLevel.NONE,
+    ],
+)
+def test_build_conformer_matches_generic(level: TypeConformanceLevel):
+    """The compiled conformer should match conform_record_data_types exactly."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "primitive": {"type": ["boolean", "null"]},
+            "object": {
+                "type": ["object", "null"],
+                "properties": {"value": {"type": ["boolean", "null"]}},
+            },
+            "list": {
+                "type": ["array", "null"],
+                "items": {
+                    "type": ["object", "boolean"],
+                    "properties": {"value": {"type": ["boolean", "null"]}},
+                },
+            },
+        },
+    }
+
+    record = {
+        "primitive": b"\x01",
+        "object": {"value": b"\x00", "extra": "goodbye"},
+        "list": [{"value": b"\x01"}, b"\x00"],
+        "unmapped": "goodbye",
+    }
+
+    expected = conform_record_data_types(
+        "test_stream", deepcopy(record), schema, level, logger
+    )
+    conformer = build_conformer("test_stream", schema, level, logger)
+    assert conformer(deepcopy(record)) == expected